@@ -1,48 +1,84 @@
 from __future__ import annotations
 
+import os
+import subprocess
 from pathlib import Path
 
 from tach.errors import TachError, TachSetupError
 
 
-def get_changed_files(
-    project_root: Path, head: str = "", base: str = "main"
-) -> list[Path]:
-    # Local import because git-python takes ~80ms to load
-    from git import GitCommandError, InvalidGitRepositoryError, NoSuchPathError, Repo
+class GitCommandError(TachError): ...
 
+
+def _run_git(args: list[str], cwd: Path) -> bytes:
     try:
-        repo = Repo(project_root, search_parent_directories=True)
-    except (InvalidGitRepositoryError, NoSuchPathError):
+        result = subprocess.run(
+            ["git", "-C", str(cwd), *args],
+            check=False,
+            capture_output=True,
+        )
+    except OSError as e:
+        raise GitCommandError(str(e)) from e
+    if result.returncode != 0:
+        raise GitCommandError(result.stderr.decode(errors="replace").strip())
+    return result.stdout
+
+
+def _get_git_root(project_root: Path) -> Path:
+    try:
+        git_root = _run_git(["rev-parse", "--show-toplevel"], cwd=project_root)
+    except GitCommandError:
         raise TachSetupError(
             "The project does not appear to be a git repository, cannot determine changed files!"
         )
+    return Path(os.fsdecode(git_root.rstrip(b"\n")))
+
+
+def _split_paths(output: bytes) -> list[bytes]:
+    # Output is requested with '-z', so paths are NUL-terminated and never quoted
+    return [filepath for filepath in output.split(b"\x00") if filepath]
+
+
+def get_changed_file_paths(
+    project_root: Path, head: str = "", base: str = "main"
+) -> list[str]:
+    git_root = _get_git_root(project_root)
 
     try:
+        # Renames are reported as a deletion and an addition so that both paths are included
         if head:
-            diff: str = repo.git.diff("--name-status", head, base)
+            diff = _run_git(
+                ["diff", "--name-only", "--no-renames", "-z", head, base], cwd=git_root
+            )
         else:
             # If head is not provided, we can diff against 'base' from the current filesystem
-            diff: str = repo.git.diff("--name-status", base)
+            diff = _run_git(
+                ["diff", "--name-only", "--no-renames", "-z", base], cwd=git_root
+            )
     except GitCommandError:
         head_display = f"'{head}'" if head else "current filesystem"
         raise TachError(f"Failed to check diff between '{base}' and {head_display}!")
 
-    diff_lines = diff.splitlines()
-    changed_files: set[str] = set()
-
-    for line in diff_lines:
-        _, *files = line.split("\t")
-        changed_files.update(files)
+    changed_files: set[bytes] = set(_split_paths(diff))
 
     if not head:
         # If we are using the current filesystem, there may be relevant changes in untracked files
-        untracked_files: str = repo.git.ls_files("--others", "--exclude-standard")
-        changed_files.update(untracked_files.splitlines())
+        untracked_files = _run_git(
+            ["ls-files", "--others", "--exclude-standard", "-z"], cwd=git_root
+        )
+        changed_files.update(_split_paths(untracked_files))
 
-    # return list of unique Paths
-    git_root: str = repo.git.rev_parse("--show-toplevel")
-    return [(Path(git_root) / filepath).resolve() for filepath in changed_files]
+    # return list of unique absolute paths, without the cost of constructing Path objects
+    return [os.path.join(git_root, os.fsdecode(filepath)) for filepath in changed_files]
+
+
+def get_changed_files(
+    project_root: Path, head: str = "", base: str = "main"
+) -> list[Path]:
+    return [
+        Path(filepath).resolve()
+        for filepath in get_changed_file_paths(project_root, head=head, base=base)
+    ]
 
 
-__all__ = ["get_changed_files"]
+__all__ = ["get_changed_files", "get_changed_file_paths"]
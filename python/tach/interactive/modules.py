@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 import fnmatch
+import os
 import re
-from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
 from itertools import chain
 from pathlib import Path
-from typing import TYPE_CHECKING, Callable, Generator
+from typing import TYPE_CHECKING, Callable, Generator, Iterable
 
 from prompt_toolkit import ANSI
 from prompt_toolkit.application import Application
@@ -24,9 +25,6 @@ from prompt_toolkit.layout import (
 from prompt_toolkit.layout.controls import FormattedTextControl
 from prompt_toolkit.styles import Style
 from prompt_toolkit.widgets import Frame
-from rich.console import Console
-from rich.text import Text
-from rich.tree import Tree
 
 from tach import errors
 from tach import filesystem as fs
@@ -36,19 +34,60 @@ if TYPE_CHECKING:
 
     from tach.core import ProjectConfig
 
+# Directory scans are I/O bound, so use more threads than cores
+SCAN_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
 
-@dataclass
 class FileNode:
-    full_path: Path
-    is_dir: bool
-    expanded: bool = False
-    is_module: bool = False
-    is_source_root: bool = False
-    parent: FileNode | None = None
-    children: list[FileNode] = field(default_factory=list)
+    # A node is created for every file and directory in the tree,
+    # so attributes are stored in slots rather than a per-instance dict
+    __slots__ = (
+        "full_path",
+        "is_dir",
+        "basename",
+        "expanded",
+        "is_module",
+        "is_source_root",
+        "scanned",
+        "sibling_index",
+        "parent",
+        "children",
+    )
+
+    def __init__(
+        self,
+        full_path: Path,
+        is_dir: bool,
+        basename: str = "",
+        expanded: bool = False,
+        is_module: bool = False,
+        is_source_root: bool = False,
+        scanned: bool = False,
+        sibling_index: int = 0,
+        parent: FileNode | None = None,
+        children: list[FileNode] | None = None,
+    ):
+        self.full_path = full_path
+        self.is_dir = is_dir
+        self.basename = basename
+        self.expanded = expanded
+        self.is_module = is_module
+        self.is_source_root = is_source_root
+        # Whether the children of this directory have been read from the filesystem
+        self.scanned = scanned
+        # Position of this node within its parent's sorted children
+        self.sibling_index = sibling_index
+        self.parent = parent
+        self.children: list[FileNode] = children if children is not None else []
+
+    def __repr__(self) -> str:
+        return f"FileNode(full_path={self.full_path!r}, is_dir={self.is_dir!r})"
 
     @property
     def empty(self) -> bool:
+        if self.is_dir and not self.scanned:
+            # Directories which have not been scanned yet may have children
+            return False
         return len(self.children) == 0
 
     @property
@@ -60,13 +99,22 @@ class FileNode:
     @classmethod
     def build_from_path(cls, path: Path) -> FileNode:
         is_dir = path.is_dir()
-        return cls(full_path=path, is_dir=is_dir)
+        return cls(full_path=path, is_dir=is_dir, basename=path.name)
+
+    @classmethod
+    def build_from_dir_entry(cls, entry: os.DirEntry[str]) -> FileNode:
+        # DirEntry caches file type information from the directory scan,
+        # so this avoids an extra stat call per node
+        return cls(
+            full_path=Path(entry.path), is_dir=entry.is_dir(), basename=entry.name
+        )
 
     @property
     def parent_sorted_children(self) -> list[FileNode] | None:
         if not self.parent:
             return None
-        return sorted(self.parent.visible_children, key=lambda node: node.full_path)
+        # Children are sorted by path when the tree is built
+        return self.parent.visible_children
 
     @property
     def prev_sibling(self) -> FileNode | None:
@@ -74,11 +122,7 @@ class FileNode:
         if not parent_sorted_children:
             return None
 
-        try:
-            my_index = parent_sorted_children.index(self)
-        except ValueError:
-            raise errors.TachError("Error occurred in interactive file tree navigation")
-
+        my_index = self._checked_sibling_index(parent_sorted_children)
         if my_index == 0:
             return None
         return parent_sorted_children[my_index - 1]
@@ -89,15 +133,19 @@ class FileNode:
         if not parent_sorted_children:
             return None
 
-        try:
-            my_index = parent_sorted_children.index(self)
-        except ValueError:
-            raise errors.TachError("Error occurred in interactive file tree navigation")
-
+        my_index = self._checked_sibling_index(parent_sorted_children)
         if my_index == len(parent_sorted_children) - 1:
             return None
         return parent_sorted_children[my_index + 1]
 
+    def _checked_sibling_index(self, parent_sorted_children: list[FileNode]) -> int:
+        if (
+            self.sibling_index >= len(parent_sorted_children)
+            or parent_sorted_children[self.sibling_index] is not self
+        ):
+            raise errors.TachError("Error occurred in interactive file tree navigation")
+        return self.sibling_index
+
     def siblings(self, include_self: bool = True) -> list[FileNode]:
         if not self.parent:
             return [self] if include_self else []
@@ -113,6 +161,8 @@ class FileNode:
 class FileTree:
     root: FileNode
     nodes: dict[str, FileNode] = field(default_factory=dict)
+    exclude_paths: list[str] | None = None
+    use_regex_matching: bool | None = None
 
     @classmethod
     def build_from_path(
@@ -121,17 +171,25 @@ class FileTree:
         depth: int | None = 1,
         exclude_paths: list[str] | None = None,
         use_regex_matching: bool | None = None,
+        lazy: bool = False,
     ) -> FileTree:
+        # When lazy, only expanded directories are scanned up front,
+        # the rest are scanned on demand through 'expand_path'
         root = FileNode.build_from_path(path)
         root.is_module = False
         root.expanded = True
-        tree = cls(root=root)
+        tree = cls(
+            root=root,
+            exclude_paths=exclude_paths,
+            use_regex_matching=use_regex_matching,
+        )
         tree.nodes[str(path)] = root
         tree._build_subtree(
             root,
             depth=depth if depth is not None else 1,
             exclude_paths=exclude_paths,
             use_regex_matching=use_regex_matching,
+            lazy=lazy,
         )
         return tree
 
@@ -141,57 +199,77 @@ class FileTree:
         depth: int = 1,
         exclude_paths: list[str] | None = None,
         use_regex_matching: bool | None = None,
+        lazy: bool = False,
     ):
-        if root.is_dir:
-            try:
-                for entry in root.full_path.iterdir():
-                    if entry.name.startswith("."):
-                        # Ignore hidden files and directories
-                        continue
-                    if entry.is_file() and not entry.name.endswith(".py"):
-                        # Only interested in Python files
-                        continue
-
-                    if entry.name == "__init__.py":
-                        # __init__.py does not have a unique module path from its containing package
-                        # so users should not be able to mark it as a standalone module
-                        continue
-
-                    # Exclude patterns are relative to project root, and may include a trailing slash
-                    if exclude_paths is not None and use_regex_matching is None:
-                        raise errors.TachError(
-                            "Must specify whether to use regex matching when providing exclude paths."
-                        )
+        # Exclude patterns are relative to project root, and may include a trailing slash
+        if exclude_paths is not None and use_regex_matching is None:
+            raise errors.TachError(
+                "Must specify whether to use regex matching when providing exclude paths."
+            )
 
-                    entry_path_for_glob = str(entry.relative_to(self.root.full_path))
-                    entry_path_for_regex = f"{entry_path_for_glob}/"
-                    if exclude_paths is not None and any(
-                        (
-                            re.match(exclude_path, entry_path_for_regex)
-                            if use_regex_matching
-                            else fnmatch.fnmatch(entry_path_for_glob, exclude_path)
-                        )
-                        for exclude_path in exclude_paths
-                    ):
-                        # This path is ignored
-                        continue
-                    child_node = FileNode.build_from_path(entry)
-                    if depth > 1:
-                        child_node.expanded = True
-                    child_node.parent = root
-                    root.children.append(child_node)
-                    self.nodes[str(entry)] = child_node
-                    if child_node.is_dir:
-                        self._build_subtree(
-                            child_node,
-                            depth=max(depth - 1, 0),
-                            exclude_paths=exclude_paths,
-                            use_regex_matching=use_regex_matching,
+        # Breadth-first traversal, scanning all directories of a level concurrently
+        level: list[tuple[FileNode, int]] = [(root, depth)] if root.is_dir else []
+        # A thread pool is only worth starting once a level has several directories to scan
+        executor: ThreadPoolExecutor | None = None
+        try:
+            while level:
+                next_level: list[tuple[FileNode, int]] = []
+                scanned_entries: Iterable[list[os.DirEntry[str]]]
+                if len(level) == 1:
+                    scanned_entries = [_scan_directory(level[0][0].full_path)]
+                else:
+                    if executor is None:
+                        executor = ThreadPoolExecutor(max_workers=SCAN_MAX_WORKERS)
+                    scanned_entries = executor.map(
+                        _scan_directory,
+                        (directory.full_path for directory, _ in level),
+                    )
+                for (directory, directory_depth), entries in zip(
+                    level, scanned_entries
+                ):
+                    directory.scanned = True
+                    # Exclude patterns match paths relative to the root,
+                    # compute the directory's part once rather than for each entry
+                    directory_path_for_glob = (
+                        ""
+                        if directory is self.root
+                        else str(directory.full_path.relative_to(self.root.full_path))
+                    )
+                    for entry in entries:
+                        child_node = FileNode.build_from_dir_entry(entry)
+                        entry_path_for_glob = os.path.join(
+                            directory_path_for_glob, entry.name
                         )
-            except PermissionError:
-                # This is expected to occur during iterdir when the directory cannot be accessed
-                # We simply bail if that happens, meaning it won't show up in the interactive viewer
-                return
+                        entry_path_for_regex = f"{entry_path_for_glob}/"
+                        if exclude_paths is not None and any(
+                            (
+                                re.match(exclude_path, entry_path_for_regex)
+                                if use_regex_matching
+                                else fnmatch.fnmatch(entry_path_for_glob, exclude_path)
+                            )
+                            for exclude_path in exclude_paths
+                        ):
+                            # This path is ignored
+                            continue
+                        if directory_depth > 1:
+                            child_node.expanded = True
+                        child_node.parent = directory
+                        directory.children.append(child_node)
+                        self.nodes[str(child_node.full_path)] = child_node
+                        if child_node.is_dir and (not lazy or child_node.expanded):
+                            next_level.append((child_node, max(directory_depth - 1, 0)))
+                    # Keep children in display order so navigation and rendering don't need to sort
+                    # Siblings share a parent, so comparing basenames is enough.
+                    # normcase keeps the case-insensitive ordering of Path comparison on Windows
+                    directory.children.sort(
+                        key=lambda node: os.path.normcase(node.basename)
+                    )
+                    for index, child_node in enumerate(directory.children):
+                        child_node.sibling_index = index
+                level = next_level
+        finally:
+            if executor is not None:
+                executor.shutdown()
 
     def expand_all_parent_dirs(self, node: FileNode) -> None:
         curr_node = node
@@ -199,9 +277,34 @@ class FileTree:
             curr_node.parent.expanded = True
             curr_node = curr_node.parent
 
+    def expand_path(self, path: Path) -> None:
+        # Scan each directory from the root down to this path (inclusive) which has not been scanned yet
+        try:
+            path_parts = iter(path.relative_to(self.root.full_path).parts)
+        except ValueError:
+            # Path is outside of the tree
+            return
+
+        curr_path = self.root.full_path
+        curr_node: FileNode | None = self.root
+        while curr_node is not None and curr_node.is_dir:
+            if not curr_node.scanned:
+                self._build_subtree(
+                    curr_node,
+                    exclude_paths=self.exclude_paths,
+                    use_regex_matching=self.use_regex_matching,
+                    lazy=True,
+                )
+            next_part = next(path_parts, None)
+            if next_part is None:
+                return
+            curr_path = curr_path / next_part
+            curr_node = self.nodes.get(str(curr_path))
+
     def initialize_modules(self, module_paths: list[Path]):
         # NOTE: module_paths here are filesystem paths; they may be files or dirs
         for module_path in module_paths:
+            self.expand_path(module_path)
             module_path = str(module_path)
             if module_path in self.nodes:
                 node = self.nodes[module_path]
@@ -211,6 +314,7 @@ class FileTree:
     def initialize_source_roots(self, source_roots: list[Path]):
         # NOTE: assuming source_roots are absolute here
         for source_root in source_roots:
+            self.expand_path(source_root)
             if str(source_root) not in self.nodes:
                 continue
             node = self.nodes[str(source_root)]
@@ -227,23 +331,41 @@ class FileTree:
         return file_tree_iterator(self, visible_only=True)
 
 
+def _scan_directory(path: Path) -> list[os.DirEntry[str]]:
+    # Runs in a worker thread, the GIL is released while scanning and stat-ing entries
+    try:
+        with os.scandir(path) as entries:
+            return [
+                entry
+                for entry in entries
+                # Ignore hidden files and directories
+                if not entry.name.startswith(".")
+                # Only interested in Python files
+                and not (entry.is_file() and not entry.name.endswith(".py"))
+                # __init__.py does not have a unique module path from its containing package
+                # so users should not be able to mark it as a standalone module
+                and entry.name != "__init__.py"
+            ]
+    except PermissionError:
+        # This is expected to occur during scandir when the directory cannot be accessed
+        # We simply bail if that happens, meaning it won't show up in the interactive viewer
+        return []
+
+
 def file_tree_iterator(
     tree: FileTree, visible_only: bool = False
 ) -> Generator[FileNode, None, None]:
     # DFS traversal for printing
-    stack = deque([tree.root])
+    stack: list[FileNode] = [tree.root]
 
     while stack:
-        node = stack.popleft()
+        node = stack.pop()
         yield node
+        # Children are already sorted, push them in reverse so the first child is popped next
         if visible_only:
-            stack.extendleft(
-                sorted(node.visible_children, key=lambda n: n.full_path, reverse=True)
-            )
+            stack.extend(reversed(node.visible_children))
         else:
-            stack.extendleft(
-                sorted(node.children, key=lambda n: n.full_path, reverse=True)
-            )
+            stack.extend(reversed(node.children))
 
 
 class ExitCode(Enum):
@@ -259,6 +381,19 @@ class InteractiveModuleConfiguration:
 
 class InteractiveModuleTree:
     TREE_LABEL = "Confirm Your Modules"
+    # Guide lines drawn before each node, matching rich.Tree
+    TREE_GUIDE_BRANCH = "├── "
+    TREE_GUIDE_LAST = "└── "
+    TREE_GUIDE_CONTINUE = "│   "
+    TREE_GUIDE_SPACE = "    "
+    # Pre-encoded ANSI escapes for the styles used by node labels
+    RESET = "\x1b[0m"
+    SELECTED_ARROW = "\x1b[1;36m-> \x1b[0m"
+    SELECTED_STYLE = "\x1b[1m"
+    SOURCE_ROOT_STYLE = "\x1b[1;36m"
+    MODULE_STYLE = "\x1b[1;33m"
+    EXPANDED_MARKER = "\x1b[36m ∨\x1b[0m"
+    COLLAPSED_MARKER = "\x1b[36m >\x1b[0m"
 
     def __init__(
         self,
@@ -274,6 +409,8 @@ class InteractiveModuleTree:
             depth=depth,
             exclude_paths=exclude_paths,
             use_regex_matching=project_config.use_regex_matching,
+            # Directories are scanned when they are first expanded
+            lazy=True,
         )
 
         source_roots = [
@@ -299,9 +436,16 @@ class InteractiveModuleTree:
         # x location doesn't matter, only need to track hidden cursor for auto-scroll behavior
         # y location starts at 1 because the FileTree is rendered with a labeled header above the first branch
         self.cursor_point = Point(x=0, y=1)
-        self.console = Console()
+        # Rendered lines of the tree, and the line on which each visible node is rendered
+        self._rendered_lines: list[str] = []
+        self._line_prefixes: list[str] = []
+        self._node_line: dict[str, int] = {}
+        # Changes waiting to be rendered on the next redraw
+        self._pending_full_render = True
+        self._pending_changed_nodes: list[FileNode] = []
+        self._tree_text = ANSI("")
         self.tree_control = FormattedTextControl(
-            text=ANSI(self._render_tree()),
+            text=self.get_tree_text_fn(),
             focusable=True,
             show_cursor=False,
             get_cursor_position=self.get_cursor_position_fn(),
@@ -331,6 +475,13 @@ class InteractiveModuleTree:
 
         return get_cursor_position
 
+    def get_tree_text_fn(self) -> Callable[[], ANSI]:
+        def get_tree_text() -> ANSI:
+            self._render_pending_changes()
+            return self._tree_text
+
+        return get_tree_text
+
     def move_cursor_up(self):
         self.cursor_point = Point(x=self.cursor_point.x, y=self.cursor_point.y - 1)
 
@@ -419,32 +570,36 @@ class InteractiveModuleTree:
 
         @self.key_bindings.add("up")
         def _(event: KeyPressEvent):
+            prev_selected_node = self.selected_node
             prev_sibling = self.selected_node.prev_sibling
             # If previous sibling exists, want to bubble down to last child of this sibling
             if prev_sibling:
                 curr_node = prev_sibling
                 while curr_node.visible_children:
-                    curr_node = sorted(
-                        curr_node.visible_children, key=lambda node: node.full_path
-                    )[-1]
+                    curr_node = curr_node.visible_children[-1]
                 self.selected_node = curr_node
                 self.move_cursor_up()
-                self._update_display()
+                self._update_display(
+                    changed_nodes=[prev_selected_node, self.selected_node]
+                )
             # If no previous sibling, go to parent
             elif self.selected_node.parent:
                 self.selected_node = self.selected_node.parent
                 self.move_cursor_up()
-                self._update_display()
+                self._update_display(
+                    changed_nodes=[prev_selected_node, self.selected_node]
+                )
 
         @self.key_bindings.add("down")
         def _(event: KeyPressEvent):
+            prev_selected_node = self.selected_node
             # If we have children, should go to first child alphabetically
             if self.selected_node.visible_children:
-                self.selected_node = sorted(
-                    self.selected_node.visible_children, key=lambda node: node.full_path
-                )[0]
+                self.selected_node = self.selected_node.visible_children[0]
                 self.move_cursor_down()
-                self._update_display()
+                self._update_display(
+                    changed_nodes=[prev_selected_node, self.selected_node]
+                )
                 return
             # If we have no children and no parent, nothing to do
             elif not self.selected_node.parent:
@@ -465,10 +620,12 @@ class InteractiveModuleTree:
 
             self.selected_node = next_sibling
             self.move_cursor_down()
-            self._update_display()
+            self._update_display(changed_nodes=[prev_selected_node, self.selected_node])
 
         @self.key_bindings.add("right")
         def _(event: KeyPressEvent):
+            if self.selected_node.is_dir and not self.selected_node.scanned:
+                self.file_tree.expand_path(self.selected_node.full_path)
             self.selected_node.expanded = True
             self._update_display()
 
@@ -487,7 +644,7 @@ class InteractiveModuleTree:
             # A module cannot also be a source root
             if self.selected_node.is_module and self.selected_node.is_source_root:
                 self.selected_node.is_source_root = False
-            self._update_display()
+            self._update_display(changed_nodes=[self.selected_node])
 
         @self.key_bindings.add("s")
         def _(event: KeyPressEvent):
@@ -496,7 +653,7 @@ class InteractiveModuleTree:
             # A source root cannot also be a module
             if self.selected_node.is_source_root and self.selected_node.is_module:
                 self.selected_node.is_module = False
-            self._update_display()
+            self._update_display(changed_nodes=[self.selected_node])
 
         @self.key_bindings.add("c-a")
         def _(event: KeyPressEvent):
@@ -504,7 +661,7 @@ class InteractiveModuleTree:
                 # This means we are the root node without siblings
                 # We should simply toggle ourselves
                 self.selected_node.is_module = not self.selected_node.is_module
-                self._update_display()
+                self._update_display(changed_nodes=[self.selected_node])
                 return
 
             # If all siblings are currently modules, we should un-set all of them (target value is False)
@@ -515,70 +672,114 @@ class InteractiveModuleTree:
             for node in self.selected_node.siblings():
                 node.is_module = not all_siblings_are_modules
 
-            self._update_display()
+            self._update_display(changed_nodes=self.selected_node.siblings())
 
         @self.key_bindings.add("c-up")
         def _(event: KeyPressEvent):
             if not self.selected_node.parent:
                 return
 
+            prev_selected_node = self.selected_node
             # Simple way to keep cursor position accurate while jumping to parent
             while self.selected_node.prev_sibling:
                 self.move_cursor_up()
                 self.selected_node = self.selected_node.prev_sibling
             self.move_cursor_up()
             self.selected_node = self.selected_node.parent
-            self._update_display()
+            self._update_display(changed_nodes=[prev_selected_node, self.selected_node])
 
-    def _render_node(self, node: FileNode) -> Text:
-        text_parts: list[tuple[str, str] | str] = []
-        if node == self.selected_node:
-            text_parts.append(("-> ", "bold cyan"))
+    def _render_node(self, node: FileNode) -> str:
+        selected_prefix = self.SELECTED_ARROW if node is self.selected_node else ""
 
-        basename = node.full_path.name
+        basename = node.basename
         if node.is_source_root:
-            text_parts.append((f"[Source Root] {basename}", "bold cyan"))
+            label = f"{self.SOURCE_ROOT_STYLE}[Source Root] {basename}{self.RESET}"
         elif node.is_module:
-            text_parts.append((f"[Module] {basename}", "bold yellow"))
-        elif node == self.selected_node:
-            text_parts.append((basename, "bold"))
+            label = f"{self.MODULE_STYLE}[Module] {basename}{self.RESET}"
+        elif node is self.selected_node:
+            label = f"{self.SELECTED_STYLE}{basename}{self.RESET}"
         else:
-            text_parts.append(basename)
+            label = basename
 
         if not node.empty and node.expanded:
-            text_parts.append((" ∨", "cyan"))
+            suffix = self.EXPANDED_MARKER
         elif not node.empty:
-            text_parts.append((" >", "cyan"))
-        return Text.assemble(*text_parts)
-
-    def _render_tree(self):
-        tree_root = Tree(self.TREE_LABEL)
-        # Mapping FileNode paths to rich.Tree branches
-        # so that we can iterate over the FileTree and use the
-        # parent pointers to find the parent rich.Tree branches
-        tree_mapping: dict[str, Tree] = {}
-
-        for node in self.file_tree.visible():
-            if node.parent is None:
-                # If no parent on FileNode, add to rich.Tree root
-                tree_node = tree_root.add(self._render_node(node))
-            else:
-                if str(node.parent.full_path) not in tree_mapping:
-                    raise errors.TachError("Failed to render module tree.")
-                # Find parent rich.Tree branch,
-                # attach this FileNode to the parent's branch
-                parent_tree_node = tree_mapping[str(node.parent.full_path)]
-                tree_node = parent_tree_node.add(self._render_node(node))
-
-            # Add this new FileNode to the mapping
-            tree_mapping[str(node.full_path)] = tree_node
-
-        with self.console.capture() as capture:
-            self.console.print(tree_root)
-        return capture.get()
-
-    def _update_display(self):
-        self.tree_control.text = ANSI(self._render_tree())
+            suffix = self.COLLAPSED_MARKER
+        else:
+            suffix = ""
+        return f"{selected_prefix}{label}{suffix}"
+
+    def _render_tree(self) -> str:
+        lines: list[str] = [self.TREE_LABEL]
+        self._line_prefixes = [""]
+        self._node_line = {}
+
+        # DFS traversal, tracking the guide prefix of each node's parent
+        # and whether the node is the last of its siblings
+        stack: list[tuple[FileNode, str, bool]] = [(self.file_tree.root, "", True)]
+        while stack:
+            node, parent_prefix, is_last = stack.pop()
+            prefix = parent_prefix + (
+                self.TREE_GUIDE_LAST if is_last else self.TREE_GUIDE_BRANCH
+            )
+            # Remember which line each node is rendered on so that later updates
+            # which don't change the tree structure can re-render only those lines
+            self._node_line[str(node.full_path)] = len(lines)
+            self._line_prefixes.append(prefix)
+            lines.append(prefix + self._render_node(node))
+
+            children = node.visible_children
+            children_prefix = parent_prefix + (
+                self.TREE_GUIDE_SPACE if is_last else self.TREE_GUIDE_CONTINUE
+            )
+            stack.extend(
+                (child, children_prefix, index == len(children) - 1)
+                for index, child in reversed(list(enumerate(children)))
+            )
+
+        self._rendered_lines = lines
+        return "\n".join(lines) + "\n"
+
+    def _render_node_line(self, node: FileNode) -> str | None:
+        line_number = self._node_line.get(str(node.full_path))
+        if line_number is None:
+            return None
+        return self._line_prefixes[line_number] + self._render_node(node)
+
+    def _update_display(self, changed_nodes: list[FileNode] | None = None):
+        # Rendering is deferred until the next redraw, so that several key presses
+        # handled together (e.g. a held arrow key) only render the tree once
+        if changed_nodes is None:
+            # Structural changes (or unknown changes) require rendering the full tree
+            self._pending_full_render = True
+        else:
+            self._pending_changed_nodes.extend(changed_nodes)
+        self.app.invalidate()
+
+    def _render_pending_changes(self):
+        changed_nodes = self._pending_changed_nodes
+        self._pending_changed_nodes = []
+        if self._pending_full_render:
+            self._pending_full_render = False
+            self._tree_text = ANSI(self._render_tree())
+            return
+        if not changed_nodes:
+            return
+
+        rendered_node_lines: dict[int, str] = {}
+        # The same node may have changed several times, only render it once
+        for node in dict.fromkeys(changed_nodes):
+            rendered_node_line = self._render_node_line(node)
+            if rendered_node_line is None:
+                self._tree_text = ANSI(self._render_tree())
+                return
+            rendered_node_lines[self._node_line[str(node.full_path)]] = (
+                rendered_node_line
+            )
+
+        for line_number, rendered_node_line in rendered_node_lines.items():
+            self._rendered_lines[line_number] = rendered_node_line
+        self._tree_text = ANSI("\n".join(self._rendered_lines) + "\n")
 
     def run(self) -> InteractiveModuleConfiguration | None:
         self.app.run()
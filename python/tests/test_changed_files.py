@@ -6,7 +6,7 @@ from pathlib import Path
 import pytest
 from git import Repo
 
-from tach.filesystem.git_ops import get_changed_files
+from tach.filesystem.git_ops import get_changed_file_paths, get_changed_files
 
 
 @pytest.fixture
@@ -98,6 +98,7 @@ def test_changed_files_new_branch(git_repo, setup_changes, expected_files):
     "setup_changes, expected_files",
     [
         (lambda repo_path: None, set()),
+        (lambda repo_path: os.utime(repo_path / "file1.txt", (0, 0)), set()),
         (
             lambda repo_path: {
                 (repo_path / "dir1/file4.txt").write_text("This is file 4."),
@@ -112,6 +113,13 @@ def test_changed_files_new_branch(git_repo, setup_changes, expected_files):
             },
             {"file1.txt", "dir1/file2.txt"},
         ),
+        (
+            lambda repo_path: {
+                (repo_path / "dir1/file with spaces.txt").write_text("Spaces"),
+                (repo_path / "dir2/fïlé.txt").write_text("Non-ASCII"),
+            },
+            {"dir1/file with spaces.txt", "dir2/fïlé.txt"},
+        ),
         (
             lambda repo_path: {
                 (repo_path / "file1.txt").rename(repo_path / "file1_renamed.txt"),
@@ -137,3 +145,18 @@ def test_changed_files_working_directory(git_repo, setup_changes, expected_files
     assert set(
         changed_file.relative_to(git_repo) for changed_file in changed_files
     ) == set(Path(filepath) for filepath in expected_files)
+
+
+def test_changed_file_paths(git_repo):
+    (git_repo / "dir1/file4.txt").write_text("This is file 4.")
+    (git_repo / "file1.txt").write_text("Changed")
+
+    changed_file_paths = get_changed_file_paths(git_repo, base="main")
+
+    assert all(isinstance(filepath, str) for filepath in changed_file_paths)
+    # git reports paths relative to the real path of the repository root
+    git_root = git_repo.resolve()
+    assert set(changed_file_paths) == {
+        str(git_root / "dir1/file4.txt"),
+        str(git_root / "file1.txt"),
+    }
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from pathlib import Path
+
 import pytest
 
-from tach.interactive.modules import FileNode, FileTree
+from tach.core import ProjectConfig
+from tach.interactive.modules import FileNode, FileTree, InteractiveModuleTree
 
 
 @pytest.fixture
@@ -58,6 +61,22 @@ def test_siblings_method(project_root):
     assert node not in siblings
 
 
+def test_children_sorted(project_root):
+    (project_root / "dir1" / "a_file.py").touch()
+    (project_root / "dir1" / "z_file.py").touch()
+    tree = FileTree.build_from_path(project_root, depth=2)
+    dir1 = tree.nodes[str(project_root / "dir1")]
+    assert [child.full_path.name for child in dir1.children] == [
+        "a_file.py",
+        "file1.py",
+        "z_file.py",
+    ]
+    assert dir1.children[0].prev_sibling is None
+    assert dir1.children[1].prev_sibling is dir1.children[0]
+    assert dir1.children[1].next_sibling is dir1.children[2]
+    assert dir1.children[2].next_sibling is None
+
+
 def test_exclude_single_file(project_root):
     exclude_paths = [r"dir1/file1\.py"]
     tree = FileTree.build_from_path(
@@ -96,3 +115,66 @@ def test_exclude_multiple_patterns(project_root):
     assert str(project_root / "dir1") not in tree.nodes
     assert str(project_root / "dir2") in tree.nodes
     assert str(project_root / "dir2" / "nested_dir") not in tree.nodes
+
+
+def test_lazy_build_from_path(project_root):
+    tree = FileTree.build_from_path(project_root, lazy=True)
+    assert str(project_root / "dir1") in tree.nodes
+    assert str(project_root / "dir1" / "file1.py") not in tree.nodes
+    dir1 = tree.nodes[str(project_root / "dir1")]
+    assert not dir1.scanned
+    assert not dir1.empty
+
+    tree.expand_path(dir1.full_path)
+    assert dir1.scanned
+    assert str(project_root / "dir1" / "file1.py") in tree.nodes
+
+
+def test_lazy_set_modules(project_root):
+    tree = FileTree.build_from_path(project_root, lazy=True)
+    tree.initialize_modules([project_root / "dir2" / "file2.py"])
+    node = tree.nodes[str(project_root / "dir2" / "file2.py")]
+    assert node.is_module
+    assert tree.nodes[str(project_root / "dir2")].expanded
+
+
+def test_relative_root(project_root, monkeypatch):
+    monkeypatch.chdir(project_root)
+    tree = FileTree.build_from_path(Path("."))
+    assert str(Path("dir1")) in tree.nodes
+    tree.initialize_modules([Path("dir1") / "file1.py"])
+    assert tree.nodes[str(Path("dir1") / "file1.py")].is_module
+
+
+@pytest.mark.parametrize(
+    "keys",
+    [
+        ["down", "down", "down", "up", "up"],
+        ["down", "down", "c-m", "down", "c-m", "up"],
+        ["down", "down", "c-a", "down", "down", "c-a", "up", "up", "up"],
+        ["down", "right", "down", "s", "c-up", "down", "down", "left", "down"],
+    ],
+)
+def test_interactive_tree_partial_render(project_root, mocker, keys):
+    module_tree = InteractiveModuleTree(
+        path=project_root,
+        project_config=ProjectConfig(source_roots=["."]),
+        exclude_paths=[],
+        depth=2,
+    )
+    mocker.patch.object(module_tree.app, "invalidate")
+    handlers = {
+        binding.keys[0]: binding.handler
+        for binding in module_tree.key_bindings.bindings
+    }
+
+    for key in keys:
+        handlers[key](mocker.Mock())
+        rendered_text = module_tree.tree_control.text().value
+        assert (
+            module_tree._node_line[str(module_tree.selected_node.full_path)]
+            == module_tree.cursor_point.y
+        )
+        # Lines re-rendered in place must match rendering the whole tree
+        module_tree._pending_full_render = True
+        assert module_tree.tree_control.text().value == rendered_text